@@ -1,10 +1,11 @@
 import json
 import logging
-from typing import Any, Dict, Iterator, List
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urlencode
 
 import requests
 
+from ..exceptions import SearchError
 from .models import FormattedResult, Match
 from .search_protocol import SearchClientProtocol
 
@@ -77,6 +78,7 @@ class SourcegraphClient(SearchClientProtocol):
         token: str = "",
         max_line_length: int = 300,
         max_output_length: int = 100000,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize Sourcegraph client.
 
@@ -85,6 +87,7 @@ class SourcegraphClient(SearchClientProtocol):
             token: Authentication token (optional for public instances)
             max_line_length: Maximum length for a single line before truncation
             max_output_length: Maximum length for the entire output before truncation
+            session: HTTP session to reuse pooled connections (a new one is created if omitted)
         """
         if not endpoint:
             raise ValueError("Sourcegraph endpoint is required")
@@ -93,6 +96,7 @@ class SourcegraphClient(SearchClientProtocol):
         self.token = token
         self.max_line_length = max_line_length
         self.max_output_length = max_output_length
+        self.session = session or requests.Session()
 
     def search(self, query: str, num: int) -> dict:
         """Execute a search query on Sourcegraph and return raw results.
@@ -103,6 +107,9 @@ class SourcegraphClient(SearchClientProtocol):
 
         Returns:
             Raw search results as a dictionary
+
+        Raises:
+            SearchError: If the search request fails
         """
         params = {
             "q": query,
@@ -123,11 +130,11 @@ class SourcegraphClient(SearchClientProtocol):
             headers["Authorization"] = f"token {self.token}"
 
         try:
-            response = requests.get(url, headers=headers, stream=True)
+            response = self.session.get(url, headers=headers, stream=True)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Sourcegraph search request failed: {e}")
-            raise requests.exceptions.HTTPError(f"Search failed: {e}")
+            raise SearchError(f"Search failed: {e}") from e
 
         matches = []
         filters = []
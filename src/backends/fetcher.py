@@ -12,12 +12,13 @@ from .content_fetcher_protocol import MAX_FILE_SIZE, ContentFetcherProtocol
 class SourcegraphContentFetcher(ContentFetcherProtocol):
     """Fetches content from Sourcegraph repositories."""
 
-    def __init__(self, endpoint: str, token: str = ""):
+    def __init__(self, endpoint: str, token: str = "", session: Optional[requests.Session] = None):
         """Initialize Sourcegraph content fetcher.
 
         Args:
             endpoint: Sourcegraph API endpoint
             token: Authentication token (optional for public instances)
+            session: HTTP session to reuse pooled connections (a new one is created if omitted)
 
         Raises:
             ValueError: If endpoint is not provided
@@ -27,6 +28,7 @@ class SourcegraphContentFetcher(ContentFetcherProtocol):
 
         self.endpoint = endpoint
         self.token = token
+        self.session = session or requests.Session()
 
         self.src_url = urljoin(self.endpoint, ".api/graphql")
 
@@ -100,7 +102,7 @@ class SourcegraphContentFetcher(ContentFetcherProtocol):
         payload = {"query": query, "variables": variables}
 
         try:
-            response = requests.post(self.src_url, json=payload, headers=headers)
+            response = self.session.post(self.src_url, json=payload, headers=headers)
             response.raise_for_status()
 
             data = response.json()
@@ -166,7 +168,7 @@ class SourcegraphContentFetcher(ContentFetcherProtocol):
         payload = {"query": query, "variables": variables}
 
         try:
-            response = requests.post(self.src_url, json=payload, headers=headers)
+            response = self.session.post(self.src_url, json=payload, headers=headers)
             response.raise_for_status()
 
             data = response.json()
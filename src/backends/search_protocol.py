@@ -20,6 +20,9 @@ class SearchClientProtocol(Protocol):
 
         Returns:
             Raw search results as a dictionary
+
+        Raises:
+            SearchError: If the search request fails
         """
         ...
 
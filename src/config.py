@@ -1,17 +1,31 @@
 import os
+from dataclasses import dataclass
+from typing import Mapping, Optional
 
 
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
-    def __init__(self) -> None:
-        self.sse_port = int(os.getenv("MCP_SSE_PORT", "8000"))
-        self.streamable_http_port = int(os.getenv("MCP_STREAMABLE_HTTP_PORT", "8080"))
-        self.sourcegraph_endpoint = self._get_required_env("SRC_ENDPOINT")
-        self.sourcegraph_token = os.getenv("SRC_ACCESS_TOKEN", "")  # Optional
+    sourcegraph_endpoint: str
+    sourcegraph_token: str = ""  # Optional
+    sse_port: int = 8000
+    streamable_http_port: int = 8080
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "ServerConfig":
+        """Build the configuration from a single snapshot of the environment."""
+        if env is None:
+            env = dict(os.environ)
+        return cls(
+            sourcegraph_endpoint=cls._get_required_env(env, "SRC_ENDPOINT"),
+            sourcegraph_token=env.get("SRC_ACCESS_TOKEN", ""),
+            sse_port=int(env.get("MCP_SSE_PORT", "8000")),
+            streamable_http_port=int(env.get("MCP_STREAMABLE_HTTP_PORT", "8080")),
+        )
 
     @staticmethod
-    def _get_required_env(key: str) -> str:
+    def _get_required_env(env: Mapping[str, str], key: str) -> str:
         """Get required environment variable or raise descriptive error."""
-        value = os.getenv(key)
+        value = env.get(key)
         if not value:
             raise ValueError(f"Required environment variable {key} is not set")
         return value
@@ -1,6 +1,6 @@
 from copy import copy
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import jinja2
 import yaml
@@ -64,6 +64,34 @@ class PromptManager:
         except ValueError as e:
             raise ValueError(f"Prompt '{prompt_name}' not found: {e}")
 
+    def load_all(
+        self, prompt_names: List[str], defaults: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Union[str, Dict[str, Any]]]:
+        """Load several prompts from the YAML data in a single pass.
+
+        Args:
+            prompt_names: Keys to load prompts from (supports dot notation for nested keys)
+            defaults: Fallback values for prompts that may be missing from the file
+
+        Returns:
+            Mapping of each prompt name to its value
+
+        Raises:
+            ValueError: If a prompt without a default is not found
+        """
+        defaults = defaults or {}
+        prompts: Dict[str, Union[str, Dict[str, Any]]] = {}
+
+        for prompt_name in prompt_names:
+            try:
+                prompts[prompt_name] = copy(self._traverse_path(self._prompt_data, prompt_name))
+            except ValueError as e:
+                if prompt_name not in defaults:
+                    raise ValueError(f"Prompt '{prompt_name}' not found: {e}")
+                prompts[prompt_name] = defaults[prompt_name]
+
+        return prompts
+
     def render_prompt(self, prompt_name: str, **prompt_args) -> str:
         """Render a prompt template with given parameters.
 
@@ -1,12 +1,18 @@
 import asyncio
+import functools
 import logging
 import pathlib
 import signal
-from typing import Any, List
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
-import requests
+import orjson
+import uvicorn
+import uvloop
 from dotenv import load_dotenv
 from fastmcp import FastMCP
+from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
@@ -14,19 +20,48 @@ from .backends import SourcegraphClient, SourcegraphContentFetcher
 from .backends.models import FormattedResult
 from .config import ServerConfig
 from .core import PromptManager
-from .exceptions import ContentFetchError, SearchError, ServerShutdownError
+from .exceptions import ContentFetchError, SearchError
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+IO_MAX_WORKERS = 16
+DEFAULT_SEARCH_LIMIT = 30
+MAX_SEARCH_LIMIT = 100
+PROMPTS_FILE = str(pathlib.Path(__file__).parent / "prompts" / "prompts.yaml")
+PROMPT_NAMES = [
+    "guides.codesearch_guide",
+    "guides.org_guide",
+    "tools.search",
+    "tools.search_prompt_guide",
+    "tools.fetch_content",
+]
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_prompts(path: str) -> Dict[str, str]:
+    """Parse a prompts file once and share the resolved prompts across server instances."""
+    return PromptManager(file_path=path).load_all(PROMPT_NAMES, defaults={"guides.org_guide": ""})
+
 
 class SourcegraphMCPServer:
     def __init__(self, config: ServerConfig) -> None:
         self.config = config
         self.server = FastMCP(sse_path="/sourcegraph/sse", message_path="/sourcegraph/messages/")
         self._shutdown_requested = False
+        self._server_task: Optional[asyncio.Task] = None
+        self._ready = False
+        # Dedicated pool for blocking backend calls so they don't contend with the default executor
+        self._executor = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="sg-io")
 
         self._setup_clients()
         self._load_prompts()
@@ -35,36 +70,40 @@ class SourcegraphMCPServer:
         self.search_client = SourcegraphClient(
             endpoint=self.config.sourcegraph_endpoint, token=self.config.sourcegraph_token
         )
+        # Share the search client's pooled session so both backends reuse connections
         self.content_fetcher = SourcegraphContentFetcher(
-            endpoint=self.config.sourcegraph_endpoint, token=self.config.sourcegraph_token
+            endpoint=self.config.sourcegraph_endpoint,
+            token=self.config.sourcegraph_token,
+            session=self.search_client.session,
         )
         logger.info("Using Sourcegraph backend")
+        self._ready = True
 
     def _load_prompts(self) -> None:
-        prompt_manager = PromptManager(file_path=pathlib.Path(__file__).parent / "prompts" / "prompts.yaml")
+        prompts = _get_prompts(PROMPTS_FILE)
 
-        self.codesearch_guide = prompt_manager._load_prompt("guides.codesearch_guide")
-        self.search_tool_description = prompt_manager._load_prompt("tools.search")
-        self.search_prompt_guide_description = prompt_manager._load_prompt("tools.search_prompt_guide")
-        self.fetch_content_description = prompt_manager._load_prompt("tools.fetch_content")
+        self.codesearch_guide = prompts["guides.codesearch_guide"]
+        self.org_guide = prompts["guides.org_guide"]
+        self.search_tool_description = prompts["tools.search"]
+        self.search_prompt_guide_description = prompts["tools.search_prompt_guide"]
+        self.fetch_content_description = prompts["tools.fetch_content"]
 
-        try:
-            self.org_guide = prompt_manager._load_prompt("guides.org_guide")
-        except Exception:
-            self.org_guide = ""
+        # Everything before the objective is constant, so build it once
+        self._prompt_prefix = (self.org_guide + "\n\n" if self.org_guide else "") + self.codesearch_guide + "\n"
+        self._prompt_suffix_fmt = "Given this guide create a Sourcegraph query for %s and call the search tool accordingly."
 
-    def signal_handler(self, sig: int, frame: Any = None) -> None:
-        """Handle termination signals for graceful shutdown."""
+    def _initiate_shutdown(self, sig: int) -> None:
+        """Handle termination signals by cancelling the running server task."""
         logger.info(f"Received signal {sig}, initiating graceful shutdown...")
         self._shutdown_requested = True
+        if self._server_task is not None:
+            self._server_task.cancel()
 
     async def fetch_content(self, repo: str, path: str) -> str:
-        if self._shutdown_requested:
-            logger.info("Shutdown in progress, declining new requests")
-            raise ServerShutdownError("Server is shutting down")
-
         try:
-            result = await asyncio.to_thread(self.content_fetcher.get_content, repo, path)
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.content_fetcher.get_content, repo, path
+            )
             return result
         except ValueError as e:
             logger.warning(f"Error fetching content from {repo}: {str(e)}")
@@ -73,61 +112,43 @@ class SourcegraphMCPServer:
             logger.error(f"Unexpected error fetching content: {e}")
             raise ContentFetchError("Error fetching content") from e
 
-    async def search(self, query: str, limit: int = 30) -> List[FormattedResult]:
-        if self._shutdown_requested:
-            logger.info("Shutdown in progress, declining new requests")
-            raise ServerShutdownError("Server is shutting down")
+    def _search_and_format(self, query: str, num_results: int) -> List[FormattedResult]:
+        """Run search and formatting together so a search costs a single thread hop."""
+        results = self.search_client.search(query, num_results)
+        return self.search_client.format_results(results, num_results)
 
-        num_results = min(max(1, limit), 100)
+    async def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[FormattedResult]:
+        num_results = DEFAULT_SEARCH_LIMIT if limit == DEFAULT_SEARCH_LIMIT else min(max(1, limit), MAX_SEARCH_LIMIT)
         logger.info(f"Search query: {query}, limit: {num_results}")
 
         try:
-            results = await asyncio.to_thread(self.search_client.search, query, num_results)
-            formatted_results = await asyncio.to_thread(self.search_client.format_results, results, num_results)
-            return formatted_results
-        except requests.exceptions.HTTPError as exc:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._search_and_format, query, num_results
+            )
+        except SearchError as exc:
             logger.error(f"Search HTTP error: {exc}")
-            raise SearchError(f"HTTP error during search: {exc}") from exc
+            raise
         except Exception as exc:
             logger.error(f"Unexpected error during search: {exc}")
             raise SearchError(f"Unexpected error during search: {exc}") from exc
 
     async def search_prompt_guide(self, objective: str) -> str:
-        if self._shutdown_requested:
-            logger.info("Shutdown in progress, declining new prompt guide requests")
-            raise ServerShutdownError("Server is shutting down")
-
-        prompt_parts = []
-
-        if self.org_guide:
-            prompt_parts.append(self.org_guide)
-            prompt_parts.append("\n\n")
-
-        prompt_parts.append(self.codesearch_guide)
-        prompt_parts.append(
-            f"\nGiven this guide create a Sourcegraph query for {objective} and call the search tool accordingly."
-        )
-
-        return "".join(prompt_parts)
+        return self._prompt_prefix + (self._prompt_suffix_fmt % (objective,))
 
     async def _safe_fetch_content(self, repo: str, path: str) -> str:
         """Safe wrapper for fetch_content that handles exceptions."""
         try:
             return await self.fetch_content(repo, path)
-        except ServerShutdownError:
-            return ""
         except ContentFetchError as e:
             return str(e)
         except Exception as e:
             logger.error(f"Unexpected error in fetch_content: {e}")
             return "error fetching content"
 
-    async def _safe_search(self, query: str, limit: int = 30) -> List[FormattedResult]:
+    async def _safe_search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[FormattedResult]:
         """Safe wrapper for search that handles exceptions."""
         try:
             return await self.search(query, limit)
-        except ServerShutdownError:
-            return []
         except SearchError as e:
             logger.error(f"Search error: {e}")
             return []
@@ -139,8 +160,6 @@ class SourcegraphMCPServer:
         """Safe wrapper for search_prompt_guide that handles exceptions."""
         try:
             return await self.search_prompt_guide(objective)
-        except ServerShutdownError:
-            return "Server is shutting down"
         except Exception as e:
             logger.error(f"Unexpected error in search_prompt_guide: {e}")
             return "Error generating search guide"
@@ -159,69 +178,84 @@ class SourcegraphMCPServer:
 
     def _register_health_endpoints(self) -> None:
         """Register health check endpoints."""
+        # Success bodies never change, so render them once and reuse the responses
+        self._health_ok_response = ORJSONResponse({"status": "ok", "service": "sourcegraph-mcp"})
+        self._ready_ok_response = ORJSONResponse(
+            {"status": "ready", "service": "sourcegraph-mcp", "backend": "sourcegraph"}
+        )
 
         @self.server.custom_route("/health", methods=["GET"])
         async def health_check(request: Request) -> Response:
             """Simple health check endpoint for liveness probe."""
-            return JSONResponse({"status": "ok", "service": "sourcegraph-mcp"})
+            return self._health_ok_response
 
         @self.server.custom_route("/ready", methods=["GET"])
         async def readiness_check(request: Request) -> Response:
             """Readiness check endpoint that verifies the service is ready."""
-            try:
-                # Check if search client is available
-                if not hasattr(self, "search_client") or self.search_client is None:
-                    return JSONResponse({"status": "not_ready", "reason": "search_client_unavailable"}, status_code=503)
-
-                # Check if content fetcher is available
-                if not hasattr(self, "content_fetcher") or self.content_fetcher is None:
-                    return JSONResponse(
-                        {"status": "not_ready", "reason": "content_fetcher_unavailable"}, status_code=503
-                    )
-
-                return JSONResponse({"status": "ready", "service": "sourcegraph-mcp", "backend": "sourcegraph"})
-            except Exception as e:
-                logger.error(f"Readiness check failed: {e}")
-                return JSONResponse({"status": "error", "reason": str(e)}, status_code=503)
+            if not self._ready:
+                return ORJSONResponse({"status": "not_ready", "reason": "clients_unavailable"}, status_code=503)
+
+            return self._ready_ok_response
+
+    def _build_app(self) -> Starlette:
+        """Combine the streamable-http and SSE transports into a single ASGI app."""
+        # The streamable-http app owns the MCP lifespan; unmatched paths fall through to the SSE app
+        app = self.server.http_app(path="/sourcegraph/mcp", transport="streamable-http")
+        app.mount("/", self.server.http_app(transport="sse"))
+        return app
+
+    @staticmethod
+    def _bind_socket(host: str, port: int) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.set_inheritable(True)
+        return sock
 
     async def _run_server(self) -> None:
-        """Run the FastMCP server with both HTTP and SSE transports."""
-
-        tasks = [
-            self.server.run_http_async(
-                transport="streamable-http",
-                host="0.0.0.0",
-                path="/sourcegraph/mcp",
-                port=self.config.streamable_http_port,
-            ),
-            self.server.run_http_async(transport="sse", host="0.0.0.0", port=self.config.sse_port),
-        ]
-        await asyncio.gather(*tasks)
+        """Run both MCP transports from one uvicorn server listening on both configured ports."""
+        ports = dict.fromkeys([self.config.streamable_http_port, self.config.sse_port])
+        sockets = [self._bind_socket("0.0.0.0", port) for port in ports]
+        server = uvicorn.Server(
+            uvicorn.Config(self._build_app(), http="httptools", lifespan="on", timeout_graceful_shutdown=0)
+        )
+        logger.info(f"Serving streamable-http and SSE transports on ports {', '.join(map(str, ports))}")
+        try:
+            await server.serve(sockets=sockets)
+        finally:
+            for sock in sockets:
+                sock.close()
 
     async def run(self) -> None:
         """Start the search server."""
-        signal.signal(signal.SIGINT, lambda sig, frame: self.signal_handler(sig, frame))
-        signal.signal(signal.SIGTERM, lambda sig, frame: self.signal_handler(sig, frame))
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._initiate_shutdown, sig)
 
         self._register_tools()
         self._register_health_endpoints()
 
         try:
             logger.info("Starting Sourcegraph MCP server...")
-            await self._run_server()
+            self._server_task = asyncio.create_task(self._run_server())
+            await self._server_task
+        except asyncio.CancelledError:
+            logger.info("Server task cancelled, shutting down")
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt (CTRL+C)")
         except Exception as exc:
             logger.error(f"Server error: {exc}")
             raise
         finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self.search_client.session.close()
             logger.info("Server has shut down.")
 
 
 def main() -> None:
-    config = ServerConfig()
+    config = ServerConfig.from_env()
     server = SourcegraphMCPServer(config)
-    asyncio.run(server.run())
+    asyncio.run(server.run(), loop_factory=uvloop.new_event_loop)
 
 
 if __name__ == "__main__":